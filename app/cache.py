@@ -1,3 +1,5 @@
+import asyncio
+import hashlib
 import json
 import os
 import tempfile
@@ -7,24 +9,54 @@ from typing import Any, Dict, Optional
 
 from app.config import CACHE_FILE, POLL_INTERVAL_SECONDS
 
+try:
+    import orjson
+except ImportError:  # fall back to stdlib json
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    # Compact, like orjson and JSONResponse; this is also the HTTP body
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 class CacheManager:
     def __init__(self) -> None:
         self._data: Optional[Dict[str, Any]] = None
         self._last_updated: float = 0.0
-        self._load_from_disk()
+        self._last_hash: Optional[bytes] = None
+        # Serialized response body minus the closing "age" field, rebuilt on update
+        self._body_prefix: Optional[bytes] = None
+
+    async def load(self) -> None:
+        """Load the persisted cache without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._load_from_disk)
 
     def _load_from_disk(self) -> None:
         if not os.path.exists(CACHE_FILE):
             logger.info("No cache file found at %s", CACHE_FILE)
             return
         try:
-            with open(CACHE_FILE, "r") as f:
-                stored = json.load(f)
-            self._data = stored.get("data")
+            with open(CACHE_FILE, "rb") as f:
+                stored = _loads(f.read())
+            self._set_data(stored.get("data"))
             self._last_updated = stored.get("last_updated", 0.0)
+            if self._body_prefix is not None:
+                self._last_hash = hashlib.blake2b(
+                    self._body_prefix, digest_size=16
+                ).digest()
             age = time.time() - self._last_updated
             logger.info(
                 "Loaded cache from disk (age: %.0f seconds)", age
@@ -33,6 +65,13 @@ class CacheManager:
             logger.warning("Failed to load cache from disk: %s", exc)
 
     def _save_to_disk(self) -> None:
+        # Skip the rewrite when the payload is identical to the last one saved.
+        # Only the serialized data is hashed; last_updated changes on every
+        # refresh, so the stored one may lag and cause an early refresh on restart.
+        digest = hashlib.blake2b(self._body_prefix, digest_size=16).digest()
+        if digest == self._last_hash:
+            logger.debug("Cache payload unchanged, skipping disk write")
+            return
         stored = {
             "data": self._data,
             "last_updated": self._last_updated,
@@ -43,9 +82,10 @@ class CacheManager:
                 dir=os.path.dirname(CACHE_FILE), suffix=".tmp"
             )
             try:
-                with os.fdopen(fd, "w") as f:
-                    json.dump(stored, f)
+                with os.fdopen(fd, "wb") as f:
+                    f.write(_dumps(stored))
                 os.replace(tmp_path, CACHE_FILE)
+                self._last_hash = digest
             except Exception:
                 os.unlink(tmp_path)
                 raise
@@ -53,10 +93,20 @@ class CacheManager:
         except OSError as exc:
             logger.warning("Failed to save cache to disk: %s", exc)
 
-    def update(self, data: Dict[str, Any]) -> None:
+    def _set_data(self, data: Optional[Dict[str, Any]]) -> None:
         self._data = data
+        if data is None:
+            self._body_prefix = None
+            return
+        # '{"ts": ..., "tide": [...]}' -> '{"ts": ..., "tide": [...],'
+        self._body_prefix = _dumps(data)[:-1] + (b"," if data else b"")
+
+    async def update_async(self, data: Dict[str, Any]) -> None:
+        """Update in-memory data immediately and persist it off the event loop."""
+        self._set_data(data)
         self._last_updated = time.time()
-        self._save_to_disk()
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._save_to_disk)
 
     @property
     def has_data(self) -> bool:
@@ -73,10 +123,16 @@ class CacheManager:
             return float("inf")
         return time.time() - self._last_updated
 
-    def get_response(self) -> Optional[Dict[str, Any]]:
-        if self._data is None:
+    def seconds_until_stale(self) -> float:
+        if not self.has_data:
+            return 0.0
+        return max(0.0, POLL_INTERVAL_SECONDS - self.get_age_seconds())
+
+    def get_response_body(self) -> Optional[bytes]:
+        """Return the cached data plus an "age" field as JSON bytes.
+
+        The data is serialized once per update; only "age" is formatted per call.
+        """
+        if self._body_prefix is None:
             return None
-        return {
-            **self._data,
-            "age": int(self.get_age_seconds()),
-        }
+        return self._body_prefix + b'"age":%d}' % int(self.get_age_seconds())
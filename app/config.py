@@ -49,7 +49,8 @@ TIDE_MODEL_DIR = os.path.join(BASE_DIR, "tide-models")
 
 # Polling
 POLL_INTERVAL_SECONDS = 1800  # 30 minutes
-BACKGROUND_CHECK_INTERVAL = 60  # seconds between staleness checks
+BACKGROUND_RETRY_INITIAL_SECONDS = 60  # initial retry delay after a failed refresh
+BACKGROUND_MAX_BACKOFF_SECONDS = 1800  # cap on retry delay while upstream is failing
 
 # Forecast
 FORECAST_HOURS = 168
@@ -59,6 +60,10 @@ TZ_OFFSET_MINUTES = 120
 
 # HTTP client
 HTTP_TIMEOUT_SECONDS = 30
+HTTP_MAX_CONNECTIONS = 16
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 8
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 300
+HTTP_CONNECT_RETRIES = 2  # retries on connection failures only
 
 # Tide model configuration
 # Options: "FES2022" (default, high resolution) or "GOT4.10" (fallback, lower resolution)
@@ -2,10 +2,15 @@ import logging
 from typing import Any, Dict, List, Optional
 
 import httpx
+import numpy as np
 
 from app.config import (
     AIR_QUALITY_API_URL,
     DUST_PARAMS,
+    HTTP_CONNECT_RETRIES,
+    HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
     HTTP_TIMEOUT_SECONDS,
     MARINE_API_URL,
     MARINE_PARAMS,
@@ -13,15 +18,38 @@ from app.config import (
     WEATHER_PARAMS,
 )
 
+try:
+    import orjson
+except ImportError:  # fall back to httpx's stdlib json decoding
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 _client: Optional[httpx.AsyncClient] = None
 
+# Request URLs are fixed, so encode the query strings once at import time
+_WEATHER_URL = httpx.URL(WEATHER_API_URL, params=WEATHER_PARAMS)
+_MARINE_URL = httpx.URL(MARINE_API_URL, params=MARINE_PARAMS)
+_DUST_URL = httpx.URL(AIR_QUALITY_API_URL, params=DUST_PARAMS)
+
 
 def get_client() -> httpx.AsyncClient:
     global _client
     if _client is None or _client.is_closed:
-        _client = httpx.AsyncClient(timeout=HTTP_TIMEOUT_SECONDS)
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+            retries=HTTP_CONNECT_RETRIES,
+        )
+        _client = httpx.AsyncClient(
+            transport=transport,
+            timeout=HTTP_TIMEOUT_SECONDS,
+            headers={"accept-encoding": "br, gzip"},
+        )
     return _client
 
 
@@ -32,8 +60,20 @@ async def close_client() -> None:
         _client = None
 
 
+def _parse_json(resp: httpx.Response) -> Any:
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
+
 def _to_int_list(values: List[Any]) -> List[int]:
-    return [int(round(float(v))) if v is not None else 0 for v in values]
+    # None -> 0, then round half-to-even (same as round()) in one NumPy pass
+    arr = np.fromiter(
+        (0.0 if v is None else v for v in values),
+        dtype=np.float64,
+        count=len(values),
+    )
+    return np.rint(arr).astype(np.int64).tolist()
 
 
 async def fetch_weather() -> Dict[str, Any]:
@@ -43,9 +83,9 @@ async def fetch_weather() -> Dict[str, Any]:
         time, wind, wind_dir, gust, temp
     """
     client = get_client()
-    resp = await client.get(WEATHER_API_URL, params=WEATHER_PARAMS)
+    resp = await client.get(_WEATHER_URL)
     resp.raise_for_status()
-    data = resp.json()
+    data = _parse_json(resp)
     hourly = data["hourly"]
 
     return {
@@ -66,19 +106,24 @@ async def fetch_daily_dust() -> Optional[List[int]]:
     """
     try:
         client = get_client()
-        resp = await client.get(AIR_QUALITY_API_URL, params=DUST_PARAMS)
+        resp = await client.get(_DUST_URL)
         resp.raise_for_status()
-        data = resp.json()
+        data = _parse_json(resp)
         hourly_dust = data["hourly"]["dust"]
 
-        # Group into 24-hour chunks and take the maximum of each day
-        daily_max: List[int] = []
-        for day in range(7):
-            start = day * 24
-            end = start + 24
-            chunk = [v for v in hourly_dust[start:end] if v is not None]
-            if chunk:
-                daily_max.append(int(round(max(chunk))))
+        # Group into 24-hour chunks and take the maximum of each day.
+        # Missing values become -inf so all-missing days can be dropped after.
+        hourly_dust = hourly_dust[:7 * 24]
+        days = -(-len(hourly_dust) // 24)
+        raw = np.full(days * 24, -np.inf)
+        raw[:len(hourly_dust)] = np.fromiter(
+            (-np.inf if v is None else v for v in hourly_dust),
+            dtype=np.float64,
+            count=len(hourly_dust),
+        )
+        daily_arr = raw.reshape(days, 24).max(axis=1)
+        daily_arr = daily_arr[np.isfinite(daily_arr)]
+        daily_max: List[int] = np.rint(daily_arr).astype(np.int64).tolist()
         return daily_max if daily_max else None
     except Exception as exc:
         logger.warning("Failed to fetch daily dust: %s", exc)
@@ -92,9 +137,9 @@ async def fetch_sea_temperature() -> Optional[List[int]]:
     """
     try:
         client = get_client()
-        resp = await client.get(MARINE_API_URL, params=MARINE_PARAMS)
+        resp = await client.get(_MARINE_URL)
         resp.raise_for_status()
-        data = resp.json()
+        data = _parse_json(resp)
         hourly = data["hourly"]
         return _to_int_list(hourly["sea_surface_temperature"])
     except Exception as exc:
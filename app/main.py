@@ -1,15 +1,20 @@
 import asyncio
-import calendar
 import logging
-from datetime import datetime
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
 from app.cache import CacheManager
-from app.config import BACKGROUND_CHECK_INTERVAL, TZ_OFFSET_MINUTES
+from app.config import (
+    BACKGROUND_MAX_BACKOFF_SECONDS,
+    BACKGROUND_RETRY_INITIAL_SECONDS,
+    TIDE_MODEL_NAME,
+    TZ_OFFSET_MINUTES,
+)
 from app.fetcher import (
     close_client,
     fetch_daily_dust,
@@ -35,27 +40,29 @@ app.add_middleware(
 
 cache = CacheManager()
 _refresh_lock = asyncio.Lock()
+_inflight_refresh: Optional["asyncio.Task[None]"] = None
+# Tide computation gets its own worker so it can't starve the default pool
+_tide_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tides")
 
 
 async def _do_refresh() -> Dict[str, Any]:
     """Fetch all data sources and assemble the response payload."""
     logger.info("Starting data refresh...")
 
-    # Fetch weather, sea temp, and dust concurrently
-    weather_data, sea_temp, dust_daily = await asyncio.gather(
+    # Fetch weather, sea temp, and dust concurrently, computing tides in a
+    # dedicated thread (CPU-bound) while the HTTP requests are in flight
+    loop = asyncio.get_running_loop()
+    weather_data, sea_temp, dust_daily, tide_data = await asyncio.gather(
         fetch_weather(),
         fetch_sea_temperature(),
         fetch_daily_dust(),
+        loop.run_in_executor(_tide_executor, compute_tides),
     )
 
-    # Compute tides in a thread pool (CPU-bound)
-    loop = asyncio.get_event_loop()
-    tide_data = await loop.run_in_executor(None, compute_tides)
-
     # Compute Unix epoch of first forecast hour (UTC)
     # time[0] is local time like "2026-01-30T01:00", tz_offset is minutes ahead of UTC
-    first_local = datetime.strptime(weather_data["time"][0], "%Y-%m-%dT%H:%M")
-    ts = int(calendar.timegm(first_local.timetuple())) - TZ_OFFSET_MINUTES * 60
+    first_local = datetime.fromisoformat(weather_data["time"][0])
+    ts = int(first_local.replace(tzinfo=timezone.utc).timestamp()) - TZ_OFFSET_MINUTES * 60
 
     result: Dict[str, Any] = {
         "ts": ts,
@@ -76,7 +83,7 @@ async def _do_refresh() -> Dict[str, Any]:
     if tide_data is not None:
         result["tide"] = tide_data
 
-    cache.update(result)
+    await cache.update_async(result)
     logger.info("Data refresh complete")
     return result
 
@@ -96,18 +103,50 @@ async def refresh_if_needed() -> None:
 
 
 async def _background_poll() -> None:
-    """Background loop that checks for staleness and refreshes."""
+    """Background loop that refreshes the cache when it goes stale.
+
+    Sleeps until the cache is due to go stale rather than polling. While
+    refreshes keep failing it backs off exponentially from
+    BACKGROUND_RETRY_INITIAL_SECONDS up to BACKGROUND_MAX_BACKOFF_SECONDS.
+    """
+    backoff = 0.0
     while True:
-        await asyncio.sleep(BACKGROUND_CHECK_INTERVAL)
+        if backoff:
+            sleep_s = backoff
+        else:
+            sleep_s = max(1.0, cache.seconds_until_stale())
+        await asyncio.sleep(sleep_s)
         try:
             await refresh_if_needed()
+            # refresh_if_needed logs and swallows refresh errors; a cache that
+            # is still stale afterwards means the refresh failed
+            failed = cache.needs_refresh
         except Exception as exc:
             logger.error("Background poll error: %s", exc, exc_info=True)
+            failed = True
+        if failed:
+            backoff = min(
+                max(backoff * 2, BACKGROUND_RETRY_INITIAL_SECONDS),
+                BACKGROUND_MAX_BACKOFF_SECONDS,
+            )
+            logger.warning("Refresh failed, next attempt in %d seconds", backoff)
+        else:
+            backoff = 0.0
 
 
 @app.on_event("startup")
 async def startup() -> None:
     logger.info("Starting Dahab Marine Conditions API")
+    await cache.load()
+    # Load FES2022 constants now so the first refresh doesn't pay for it
+    if TIDE_MODEL_NAME == "FES2022":
+        from app.tides_fes2022 import _load_constants
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                _tide_executor, _load_constants
+            )
+        except Exception as exc:
+            logger.error("Failed to pre-load FES2022 constants: %s", exc, exc_info=True)
     # Do initial fetch if cache is empty or stale
     try:
         await refresh_if_needed()
@@ -121,25 +160,31 @@ async def startup() -> None:
 @app.on_event("shutdown")
 async def shutdown() -> None:
     await close_client()
+    _tide_executor.shutdown(wait=False)
     logger.info("Shutdown complete")
 
 
 @app.get("/api/conditions")
-async def get_conditions() -> JSONResponse:
+async def get_conditions() -> Response:
     """Return current marine conditions data.
 
     Returns cached data immediately. Triggers background refresh if stale.
     """
-    # Trigger background refresh if needed (non-blocking)
-    asyncio.ensure_future(refresh_if_needed())
-
-    response = cache.get_response()
-    if response is None:
+    global _inflight_refresh
+    # Trigger background refresh if needed (non-blocking, one task at a time)
+    if cache.needs_refresh and (
+        _inflight_refresh is None or _inflight_refresh.done()
+    ):
+        _inflight_refresh = asyncio.ensure_future(refresh_if_needed())
+
+    body = cache.get_response_body()
+    if body is None:
         return JSONResponse(
             status_code=503,
             content={"error": "Data not yet available, try again shortly"},
         )
-    return JSONResponse(content=response)
+    # Body is serialized once per cache update; no per-request JSON encoding
+    return Response(content=body, media_type="application/json")
 
 
 @app.get("/api/health")
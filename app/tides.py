@@ -1,6 +1,6 @@
 import logging
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
 
 import numpy as np
 
@@ -15,6 +15,10 @@ from app.config import (
 
 logger = logging.getLogger(__name__)
 
+# Last computed forecast, keyed by (model, start hour); tides only change hourly
+_last_key: Optional[Tuple[str, int]] = None
+_last_result: Optional[List[int]] = None
+
 
 def compute_tides() -> Optional[List[int]]:
     """Compute hourly tide heights using the configured model.
@@ -39,19 +43,23 @@ def _compute_tides_got410() -> Optional[List[int]]:
     Uses pyTMD with the GOT4.10 model and extrapolation (Red Sea is narrow,
     the model grid may not cover Dahab directly).
     """
+    global _last_key, _last_result
     try:
         import pyTMD
 
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
         epoch = datetime(2000, 1, 1, 0, 0, 0)
         base_seconds = (now - epoch).total_seconds()
         # Round down to the current hour
         base_seconds = (base_seconds // 3600) * 3600
 
+        key = ("GOT4.10", int(base_seconds))
+        if key == _last_key and _last_result is not None:
+            logger.info("Reusing tide values computed for the current hour")
+            return list(_last_result)
+
         n = FORECAST_HOURS
-        delta_times = np.array(
-            [base_seconds + i * 3600 for i in range(n)]
-        )
+        delta_times = base_seconds + np.arange(n, dtype=np.float64) * 3600.0
         lons = np.full(n, LONGITUDE)
         lats = np.full(n, LATITUDE)
 
@@ -71,15 +79,18 @@ def _compute_tides_got410() -> Optional[List[int]]:
         )
 
         # Convert to cm and apply datum offset (MSL → chart datum)
-        tide_cm = [int(round(float(t) * 100)) + TIDE_DATUM_OFFSET_CM for t in tide]
+        tide_arr = np.asarray(tide, dtype=np.float64)
+        tide_cm_arr = np.rint(tide_arr * 100.0).astype(np.int32) + TIDE_DATUM_OFFSET_CM
+        tide_cm = tide_cm_arr.tolist()
         logger.info(
             "Computed %d tide values (range: %d to %d cm, offset: +%d cm)",
             len(tide_cm),
-            min(tide_cm),
-            max(tide_cm),
+            int(tide_cm_arr.min()),
+            int(tide_cm_arr.max()),
             TIDE_DATUM_OFFSET_CM,
         )
-        return tide_cm
+        _last_key, _last_result = key, tide_cm
+        return list(tide_cm)
 
     except Exception as exc:
         logger.error("Tide computation failed: %s", exc, exc_info=True)
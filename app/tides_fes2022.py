@@ -1,13 +1,14 @@
 """FES2022 tide computation module.
 
-Uses pre-extracted harmonic constants from dahab_constants.json for fast
-tide predictions. The constants are extracted once using extract_fes2022_constants.py.
+Uses pre-extracted harmonic constants from dahab_constants.npz (falling back to
+dahab_constants.json) for fast tide predictions. The constants are extracted once
+using extract_fes2022_constants.py.
 """
 import json
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import numpy as np
 
@@ -20,24 +21,59 @@ from app.config import (
 logger = logging.getLogger(__name__)
 
 CACHE_FILE = Path(TIDE_MODEL_DIR) / 'FES2022' / 'dahab_constants.json'
+NPZ_CACHE_FILE = CACHE_FILE.with_suffix('.npz')
 
 # Cached constants (loaded on first use)
 _cached_constants = None
 
+# Last computed forecast, keyed by (model, start hour); tides only change hourly
+_last_key: Optional[Tuple[str, int]] = None
+_last_result: Optional[List[int]] = None
+
+
+def _read_npz(path: Path) -> dict:
+    with np.load(path, allow_pickle=False) as d:
+        return {
+            'constituents': d['constituents'].tolist(),
+            'amplitude': d['amp'],
+            'phase': d['ph'],
+            'latitude': float(d['latitude']),
+            'longitude': float(d['longitude']),
+        }
+
+
+def _read_json(path: Path) -> dict:
+    with open(path) as f:
+        constants = json.load(f)
+    constants['amplitude'] = np.array(constants['amplitude'], dtype=np.float64)
+    constants['phase'] = np.array(constants['phase'], dtype=np.float64)
+    return constants
+
 
 def _load_constants():
-    """Load pre-extracted harmonic constants from cache file."""
+    """Load pre-extracted harmonic constants from cache file.
+
+    Prefers the .npz cache; falls back to the JSON cache for installs
+    extracted before the .npz file was introduced.
+    """
     global _cached_constants
     if _cached_constants is not None:
         return _cached_constants
 
-    if not CACHE_FILE.exists():
-        logger.error("FES2022 constants cache not found: %s", CACHE_FILE)
+    if NPZ_CACHE_FILE.exists():
+        _cached_constants = _read_npz(NPZ_CACHE_FILE)
+    elif CACHE_FILE.exists():
+        _cached_constants = _read_json(CACHE_FILE)
+    else:
+        logger.error("FES2022 constants cache not found: %s", NPZ_CACHE_FILE)
         logger.error("Run: python3 extract_fes2022_constants.py")
         return None
 
-    with open(CACHE_FILE) as f:
-        _cached_constants = json.load(f)
+    # Complex harmonic constants for the fixed Dahab point, computed once.
+    # Must use -1j to match pyTMD's internal convention (see compute_tide_corrections)
+    _cached_constants['hc'] = _cached_constants['amplitude'] * np.exp(
+        -1j * np.deg2rad(_cached_constants['phase'])
+    )
 
     logger.info(
         "Loaded FES2022 constants: %d constituents for (%.4f, %.4f)",
@@ -54,6 +90,7 @@ def compute_tides_fes2022() -> Optional[List[int]]:
     Returns list of tide heights in centimeters, or None if computation fails.
     Uses pre-extracted harmonic constants for fast computation.
     """
+    global _last_key, _last_result
     try:
         import pyTMD.arguments
         import pyTMD.predict
@@ -64,28 +101,31 @@ def compute_tides_fes2022() -> Optional[List[int]]:
             return None
 
         constituents = constants['constituents']
-        amp = np.array(constants['amplitude'])  # meters
-        ph = np.array(constants['phase'])       # degrees
+        hc_single = constants['hc']  # (nconstituents,) complex
 
         # Time setup - pyTMD.predict.drift uses days since 1992-01-01
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
         epoch_1992 = datetime(1992, 1, 1, 0, 0, 0)
         base_days = (now - epoch_1992).total_seconds() / 86400.0
         base_days = (base_days // (1/24)) * (1/24)  # Round to hour
 
+        key = ("FES2022", int(round(base_days * 24)))
+        if key == _last_key and _last_result is not None:
+            logger.info("FES2022: Reusing tide values computed for the current hour")
+            return list(_last_result)
+
         n = FORECAST_HOURS
 
         # Create time array (days since 1992-01-01)
-        t = np.array([base_days + i / 24.0 for i in range(n)])
+        t = base_days + np.arange(n, dtype=np.float64) / 24.0
 
-        # Convert amplitude/phase to complex harmonic constants
-        # Must use -1j to match pyTMD's internal convention (see compute_tide_corrections)
         # Shape must be (npts, nconstituents) - we have n time points, 1 spatial point
-        # pyTMD expects masked arrays
-        ph_rad = np.deg2rad(ph)
-        hc_single = amp * np.exp(-1j * ph_rad)  # (nconstituents,)
-        hc = np.ma.array(np.tile(hc_single, (n, 1)))  # (n, nconstituents) as masked array
-        hc.mask = np.zeros_like(hc, dtype=bool)  # No masked values
+        # pyTMD expects masked arrays; drift() only reads hc, so a broadcast
+        # view of the single-point constants avoids copying it n times
+        hc = np.ma.array(
+            np.broadcast_to(hc_single, (n, len(constituents))),
+            mask=False,
+        )
 
         # Predict tides using harmonic synthesis
         tide = pyTMD.predict.drift(
@@ -97,16 +137,19 @@ def compute_tides_fes2022() -> Optional[List[int]]:
         )
 
         # Convert to cm and apply datum offset
-        tide_cm = [int(round(float(t) * 100)) + TIDE_DATUM_OFFSET_CM for t in tide]
+        tide_arr = np.asarray(tide, dtype=np.float64)
+        tide_cm_arr = np.rint(tide_arr * 100.0).astype(np.int32) + TIDE_DATUM_OFFSET_CM
+        tide_cm = tide_cm_arr.tolist()
 
         logger.info(
             "FES2022: Computed %d tide values (range: %d to %d cm, offset: +%d cm)",
             len(tide_cm),
-            min(tide_cm),
-            max(tide_cm),
+            int(tide_cm_arr.min()),
+            int(tide_cm_arr.max()),
             TIDE_DATUM_OFFSET_CM,
         )
-        return tide_cm
+        _last_key, _last_result = key, tide_cm
+        return list(tide_cm)
 
     except Exception as exc:
         logger.error("FES2022 tide computation failed: %s", exc, exc_info=True)
@@ -115,14 +158,15 @@ def compute_tides_fes2022() -> Optional[List[int]]:
 
 def verify_fes2022_installation() -> dict:
     """Check if FES2022 is properly installed and return status."""
+    cache_file = NPZ_CACHE_FILE if NPZ_CACHE_FILE.exists() else CACHE_FILE
     result = {
-        'cache_file': str(CACHE_FILE),
-        'cache_exists': CACHE_FILE.exists(),
+        'cache_file': str(cache_file),
+        'cache_exists': cache_file.exists(),
         'constituents_count': 0,
         'ready': False,
     }
 
-    if CACHE_FILE.exists():
+    if cache_file.exists():
         try:
             constants = _load_constants()
             if constants:
@@ -2,7 +2,7 @@
 """Extract FES2022 harmonic constants for Dahab and cache them.
 
 This only needs to run once. The extracted constants are saved to a small
-JSON file that can be loaded quickly for tide predictions.
+JSON file, plus a .npz copy that the API loads without any text parsing.
 """
 import json
 import sys
@@ -24,6 +24,7 @@ CONSTITUENTS = [
 
 MODEL_DIR = Path(TIDE_MODEL_DIR) / 'FES2022' / 'ocean_tide_extrapolated'
 CACHE_FILE = Path(TIDE_MODEL_DIR) / 'FES2022' / 'dahab_constants.json'
+NPZ_CACHE_FILE = CACHE_FILE.with_suffix('.npz')
 
 
 def extract_constants():
@@ -86,9 +87,19 @@ def extract_constants():
     with open(CACHE_FILE, 'w') as f:
         json.dump(results, f, indent=2)
 
+    np.savez(
+        NPZ_CACHE_FILE,
+        amp=np.array(results['amplitude'], dtype=np.float64),
+        ph=np.array(results['phase'], dtype=np.float64),
+        constituents=np.array(results['constituents']),
+        latitude=np.float64(LATITUDE),
+        longitude=np.float64(LONGITUDE),
+    )
+
     print()
     print(f"Extracted {len(results['constituents'])} constituents")
     print(f"Saved to: {CACHE_FILE}")
+    print(f"Saved to: {NPZ_CACHE_FILE}")
 
     # Show major constituents
     print()